@@ -1,6 +1,10 @@
-from webdriver_factory import WebDriverFactory
+import logging
 
+from webdriver_factory import get_factory
 
-factory = WebDriverFactory()
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+factory = get_factory()
 with factory.get_driver() as driver:
     driver.get("http://google.com.br")
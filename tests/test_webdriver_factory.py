@@ -0,0 +1,365 @@
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import NoSuchDriverException, SessionNotCreatedException, WebDriverException
+from urllib3.exceptions import MaxRetryError
+
+import webdriver_factory
+from webdriver_factory import WebDriverFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_driver_path_cache():
+    WebDriverFactory._driver_path_cache.clear()
+    WebDriverFactory._browser_path_cache.clear()
+    yield
+    WebDriverFactory._driver_path_cache.clear()
+    WebDriverFactory._browser_path_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def driver_finder():
+    with mock.patch.object(webdriver_factory, "DriverFinder") as finder:
+        finder.return_value.get_driver_path.side_effect = NoSuchDriverException("sem driver")
+        yield finder
+
+
+def make_factory(pool_size: int = 1) -> WebDriverFactory:
+    with mock.patch.object(webdriver_factory, "_POOL_SIZE", pool_size):
+        factory = WebDriverFactory(browser="chrome")
+    # Descarta a busca em segundo plano para que os testes controlem a resolução do driver
+    factory._driver_path_future.result()
+    factory._driver_path_future = None
+    return factory
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, 1), ("", 1), ("3", 3), ("0", 0), ("-2", 0), ("abc", 1)],
+)
+def test_parse_pool_size(value, expected):
+    assert webdriver_factory._parse_pool_size(value) == expected
+
+
+def test_build_firefox_options_applies_all_prefs():
+    options = webdriver_factory._build_firefox_options("/tmp")
+    prefs = webdriver_factory._build_firefox_prefs("/tmp")
+    expected = webdriver_factory.FirefoxOptions()
+    # O Selenium já define preferências padrão (ex.: remote.active-protocols)
+    defaults = dict(expected.preferences)
+    for key, value in prefs.items():
+        expected.set_preference(key, value)
+
+    assert options.preferences == {**defaults, **prefs}
+    assert options.preferences == expected.preferences
+
+
+def test_build_firefox_options_falls_back_to_set_preference():
+    with mock.patch.object(webdriver_factory, "FirefoxOptions") as firefox_options:
+        firefox_options.return_value.preferences = None
+        options = webdriver_factory._build_firefox_options("/tmp")
+
+    prefs = webdriver_factory._build_firefox_prefs("/tmp")
+    assert options.set_preference.call_args_list == [mock.call(name=key, value=value) for key, value in prefs.items()]
+
+
+def test_acquire_reuses_released_driver():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    with mock.patch.object(factory, "get_driver", return_value=driver) as get_driver:
+        assert factory.acquire() is driver
+        factory.release(driver)
+        assert factory.acquire() is driver
+
+    get_driver.assert_called_once()
+    driver.execute_cdp_cmd.assert_called_once_with("Network.clearBrowserCookies", {})
+    driver.quit.assert_not_called()
+
+
+def test_acquire_discards_idle_driver_that_stopped_responding():
+    factory = make_factory(pool_size=3)
+    closed, crashed, alive = mock.MagicMock(), mock.MagicMock(), mock.MagicMock()
+    type(closed).current_url = mock.PropertyMock(side_effect=WebDriverException("navegador fechado"))
+    type(crashed).current_url = mock.PropertyMock(side_effect=MaxRetryError(pool=None, url="/session"))
+    for driver in (alive, crashed, closed):
+        factory.release(driver)
+
+    with mock.patch.object(factory, "get_driver") as get_driver:
+        assert factory.acquire() is alive
+
+    get_driver.assert_not_called()
+    closed.quit.assert_called_once()
+    crashed.quit.assert_called_once()
+    alive.quit.assert_not_called()
+
+
+def test_acquire_starts_new_driver_when_no_idle_driver_responds():
+    factory = make_factory()
+    stale, driver = mock.MagicMock(), mock.MagicMock()
+    type(stale).current_url = mock.PropertyMock(side_effect=WebDriverException("sessão inválida"))
+    factory.release(stale)
+
+    with mock.patch.object(factory, "get_driver", return_value=driver):
+        assert factory.acquire() is driver
+
+    stale.quit.assert_called_once()
+    assert factory._pool.empty()
+
+
+def test_release_quits_driver_when_pool_is_full():
+    factory = make_factory(pool_size=1)
+    first, second = mock.MagicMock(), mock.MagicMock()
+
+    factory.release(first)
+    factory.release(second)
+
+    first.quit.assert_not_called()
+    second.quit.assert_called_once()
+
+
+def test_release_quits_driver_when_pool_is_disabled():
+    factory = make_factory(pool_size=0)
+    driver = mock.MagicMock()
+
+    factory.release(driver)
+
+    driver.quit.assert_called_once()
+    assert factory._pool.empty()
+
+
+def test_pooled_driver_keeps_user_error_when_driver_is_gone():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    driver.execute_script.side_effect = MaxRetryError(pool=None, url="/session")
+    driver.quit.side_effect = MaxRetryError(pool=None, url="/session")
+
+    with mock.patch.object(factory, "get_driver", return_value=driver):
+        with pytest.raises(RuntimeError, match="erro do usuário"):
+            with factory.pooled_driver():
+                raise RuntimeError("erro do usuário")
+
+    driver.quit.assert_called_once()
+    assert factory._pool.empty()
+
+
+def test_close_pool_quits_idle_drivers():
+    factory = make_factory(pool_size=2)
+    drivers = [mock.MagicMock(), mock.MagicMock()]
+    for driver in drivers:
+        factory.release(driver)
+
+    factory.close_pool()
+
+    for driver in drivers:
+        driver.quit.assert_called_once()
+
+
+@pytest.fixture
+def drivers_json(tmp_path):
+    chromedriver = tmp_path / "chromedriver"
+    chromedriver.write_text("")
+    metadata = {
+        "linux64_chromedriver_120.0.6099.109_for_120.0.6099": {"binary_path": str(chromedriver)},
+        "linux64_chromedriver_121.0.6167.85_for_121.0.6167": {"binary_path": str(chromedriver)},
+        "linux64_geckodriver_0.34.0_for_120.0.6099": {"binary_path": str(chromedriver)},
+        "linux64_chromedriver_122.0.6261.57_for_122.0.6261": {"binary_path": str(tmp_path / "removido")},
+    }
+    with (
+        mock.patch("webdriver_manager.core.driver_cache.DriverCacheManager.get_os_type", return_value="linux64"),
+        mock.patch(
+            "webdriver_manager.core.driver_cache.DriverCacheManager.load_metadata_content", return_value=metadata
+        ),
+    ):
+        yield chromedriver
+
+
+def fake_manager(browser_version: str | None) -> mock.MagicMock:
+    manager = mock.MagicMock()
+    manager.return_value.driver.get_name.return_value = "chromedriver"
+    manager.return_value.driver.get_browser_version_from_os.return_value = browser_version
+    return manager
+
+
+def test_find_local_driver_matches_installed_browser_version(drivers_json):
+    factory = make_factory()
+
+    assert factory._find_local_driver(fake_manager("120.0.6099")) == str(drivers_json)
+
+
+def test_find_local_driver_ignores_driver_for_other_browser_version(drivers_json):
+    factory = make_factory()
+
+    assert factory._find_local_driver(fake_manager("119.0.6045")) is None
+
+
+def test_find_local_driver_ignores_missing_binary(drivers_json):
+    factory = make_factory()
+
+    assert factory._find_local_driver(fake_manager("122.0.6261")) is None
+
+
+def test_find_local_driver_skips_cache_without_browser_version(drivers_json):
+    factory = make_factory()
+
+    assert factory._find_local_driver(fake_manager(None)) is None
+
+
+def test_get_driver_falls_back_to_webdriver_manager():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    with (
+        mock.patch.object(factory, "_get_driver_path", return_value=None),
+        mock.patch.object(factory, "_install_driver", return_value="/wdm/chromedriver") as install_driver,
+        mock.patch.object(factory, "_start_driver", side_effect=[NoSuchDriverException("sem driver"), driver]) as start,
+    ):
+        assert factory.get_driver() is driver
+
+    install_driver.assert_called_once()
+    assert not start.call_args_list[0].args[2].path
+    assert start.call_args_list[1].args[2].path == "/wdm/chromedriver"
+
+
+def test_get_driver_retries_incompatible_driver_with_selenium_manager():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    WebDriverFactory._driver_path_cache["chrome"] = "/old/chromedriver"
+    with (
+        mock.patch.object(factory, "_install_driver") as install_driver,
+        mock.patch.object(
+            factory, "_start_driver", side_effect=[SessionNotCreatedException("versão incompatível"), driver]
+        ) as start,
+    ):
+        assert factory.get_driver() is driver
+
+    install_driver.assert_not_called()
+    assert "chrome" not in WebDriverFactory._driver_path_cache
+    assert start.call_args_list[0].args[2].path == "/old/chromedriver"
+    assert not start.call_args_list[1].args[2].path
+
+
+def test_get_driver_caches_path_resolved_by_selenium_manager():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    driver.service.path = "/selenium-manager/chromedriver"
+    driver_class = mock.MagicMock(side_effect=[SessionNotCreatedException("versão incompatível"), driver])
+    browser = (driver_class, *WebDriverFactory._browsers["chrome"][1:])
+    with (
+        mock.patch.dict(WebDriverFactory._browsers, {"chrome": browser}),
+        mock.patch("shutil.which", return_value="/usr/bin/chromedriver"),
+    ):
+        assert factory.get_driver() is driver
+        assert factory._get_driver_path() == "/selenium-manager/chromedriver"
+
+    assert driver_class.call_args_list[0].kwargs["service"].path == "/usr/bin/chromedriver"
+    assert not driver_class.call_args_list[1].kwargs["service"].path
+
+
+def test_start_driver_caches_browser_located_by_selenium_manager():
+    factory = make_factory()
+    driver = mock.MagicMock()
+    driver.service.path = "/selenium-manager/chromedriver"
+
+    def start_browser(options, service):
+        options.binary_location = "/selenium-manager/chrome"
+        return driver
+
+    factory._start_driver(mock.MagicMock(side_effect=start_browser), factory._new_options(), mock.MagicMock())
+
+    assert factory._new_options().binary_location == "/selenium-manager/chrome"
+    factory._forget_driver_path()
+    assert factory._new_options().binary_location == ""
+
+
+def test_get_driver_uses_path_prefetched_by_selenium_manager(driver_finder):
+    finder = driver_finder.return_value
+    finder.get_driver_path.side_effect = None
+    finder.get_driver_path.return_value = "/selenium-manager/chromedriver"
+    finder.get_browser_path.return_value = "/selenium-manager/chrome"
+    driver = mock.MagicMock()
+    with mock.patch("shutil.which", return_value=None):
+        factory = WebDriverFactory(browser="chrome")
+        with mock.patch.object(factory, "_start_driver", return_value=driver) as start:
+            assert factory.get_driver() is driver
+
+    assert start.call_args.args[1].binary_location == "/selenium-manager/chrome"
+    assert start.call_args.args[2].path == "/selenium-manager/chromedriver"
+    assert WebDriverFactory._driver_path_cache["chrome"] == "/selenium-manager/chromedriver"
+
+
+def test_get_driver_skips_selenium_manager_when_prefetch_failed():
+    driver = mock.MagicMock()
+    with mock.patch("shutil.which", return_value=None):
+        factory = WebDriverFactory(browser="chrome")
+        with (
+            mock.patch.object(factory, "_install_driver", return_value="/wdm/chromedriver"),
+            mock.patch.object(factory, "_start_driver", return_value=driver) as start,
+        ):
+            assert factory.get_driver() is driver
+
+    start.assert_called_once()
+    assert start.call_args.args[2].path == "/wdm/chromedriver"
+
+
+def test_get_driver_raises_value_error_when_session_cannot_be_created():
+    factory = make_factory()
+    with (
+        mock.patch.object(factory, "_get_driver_path", return_value=None),
+        mock.patch.object(factory, "_start_driver", side_effect=SessionNotCreatedException("navegador ausente")),
+    ):
+        with pytest.raises(ValueError, match="CHROME"):
+            factory.get_driver()
+
+
+def make_service(is_connectable, **attrs) -> webdriver_factory._ChromeService:
+    service = webdriver_factory._ChromeService(executable_path="/usr/bin/chromedriver")
+    for name, value in {
+        "_start_process": mock.MagicMock(),
+        "is_connectable": mock.MagicMock(side_effect=is_connectable),
+        "assert_process_still_running": mock.MagicMock(),
+        **attrs,
+    }.items():
+        setattr(service, name, value)
+    return service
+
+
+def test_service_start_returns_once_port_connects():
+    service = make_service([False, False, True])
+
+    with mock.patch("time.sleep") as sleep:
+        service.start()
+
+    service._start_process.assert_called_once_with("/usr/bin/chromedriver")
+    assert service.is_connectable.call_count == 3
+    assert service.assert_process_still_running.call_count == 2
+    sleep.assert_called_with(webdriver_factory._FastStartServiceMixin._poll_interval)
+
+
+def test_service_start_raises_after_timeout():
+    service = make_service(lambda: False, _start_timeout=0.05)
+
+    with pytest.raises(WebDriverException, match="Can not connect"):
+        service.start()
+
+    assert service.assert_process_still_running.call_count > 1
+
+
+def test_service_start_surfaces_exited_driver_process():
+    exited = WebDriverException("Service /usr/bin/chromedriver unexpectedly exited. Status code was: 1")
+    service = make_service(lambda: False, assert_process_still_running=mock.MagicMock(side_effect=exited))
+
+    with pytest.raises(WebDriverException, match="unexpectedly exited"):
+        service.start()
+
+    service.is_connectable.assert_called_once()
+
+
+def test_get_factory_normalizes_browser_name():
+    factory = webdriver_factory.get_factory("chrome")
+
+    assert webdriver_factory.get_factory(browser="CHROME") is factory
+    assert webdriver_factory.get_factory(" Chrome ") is factory
+    other = webdriver_factory.get_factory("chrome", headless=not factory.headless)
+    assert other is not factory
+    for created in (factory, other):
+        if created._driver_path_future is not None:
+            created._driver_path_future.result()
@@ -1,11 +1,18 @@
-import json
+import atexit
+import functools
 import logging
 import os
-from abc import ABC, abstractmethod
-from typing import Dict
+import queue
+import shutil
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Protocol
 
 from dotenv import load_dotenv
-from selenium.common.exceptions import SessionNotCreatedException
+from selenium.common.exceptions import NoSuchDriverException, SessionNotCreatedException, WebDriverException
 from selenium.webdriver import Chrome, Firefox, Edge
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -13,205 +20,722 @@ from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.common.service import Service
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from urllib3.exceptions import MaxRetryError
+
+if TYPE_CHECKING:
+    from webdriver_manager.core.driver import Driver
+
+
+# Nível e formato dos logs ficam a cargo da aplicação (ex.: logging.basicConfig)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Evita reler o arquivo .env quando o módulo é recarregado (importlib.reload)
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv(override=True)
+    _DOTENV_LOADED = True
+
+_BROWSER = os.getenv(key="BROWSER", default="chrome").lower()
+_HEADLESS = os.getenv(key="HEADLESS", default="false").lower() == "true"
+_DOWNLOAD_DIR = os.getcwd()
+
+
+def _parse_pool_size(value: str | None) -> int:
+    """Converte o valor de WEBDRIVER_POOL_SIZE no tamanho do pool.
+
+    :param str | None value: Valor da variável de ambiente.
+    :return int: Tamanho do pool; 0 desativa o pool (padrão: 1).
+    """
+    if not value or not value.strip():
+        return 1
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning("Valor inválido para WEBDRIVER_POOL_SIZE: %r. Utilizando 1.", value)
+        return 1
+
+
+_POOL_SIZE = _parse_pool_size(os.getenv(key="WEBDRIVER_POOL_SIZE"))
+
+
+# Configuração de impressão "Salvar como PDF" já serializada em JSON
+_APPSTATE_JSON = (
+    '{"recentDestinations":[{"id":"Save as PDF","origin":"local","account":""}],'
+    '"selectedDestinationId":"Save as PDF","version":2}'
+)
+
+# Preferências estáticas, compartilhadas entre as chamadas sem cópia
+_CHROME_PREFS = MappingProxyType(
+    {
+        "printing.print_preview_sticky_settings.appState": _APPSTATE_JSON,
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "plugins.always_open_pdf_externally": True,
+        "ignore-certificate-errors": True,
+        "ignore-ssl-errors=yes": True,
+        "allow-running-insecure-content": True,
+        "disable-web-security": True,
+        "profile.accept_untrusted_certs": True,
+        "safebrowsing.enabled": True,
+        "plugins.plugins_disabled": ("Chrome PDF Viewer",),
+        "safebrowsing.disable_download_protection": True,
+        "profile.default_content_settings.popups": 0,
+    }
+)
 
+_FIREFOX_PREFS = MappingProxyType(
+    {
+        "browser.download.folderList": 2,  # 2 = Usar diretório customizado
+        "browser.helperApps.neverAsk.saveToDisk": "application/pdf, application/octet-stream",
+        "pdfjs.disabled": True,  # Abre PDF externamente
+    }
+)
+
+_EDGE_PREFS = MappingProxyType(
+    {
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True,
+        "plugins.always_open_pdf_externally": True,
+        "excludeSwitches.enable-logging": True,
+    }
+)
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-load_dotenv(override=True)
+@functools.lru_cache(maxsize=4)
+def _build_chrome_prefs(download_dir: str) -> Mapping[str, object]:
+    """Monta uma única vez as preferências do Chrome para o diretório informado.
 
+    :param str download_dir: Diretório de downloads.
+    :return Mapping[str, object]: Preferências imutáveis do Chrome.
+    """
+    prefs = {
+        **_CHROME_PREFS,
+        "download.default_directory": download_dir,
+        "savefile.default_directory": download_dir,
+    }
+    return MappingProxyType(prefs)
 
-class WebDriverOptions(ABC):
-    """Interface para configuração de opções e preferências do navegador."""
 
-    def __init__(self) -> None:
-        """Define o diretório padrão de downloads."""
-        self.diretorio_download = os.getcwd()
+@functools.lru_cache(maxsize=4)
+def _build_firefox_prefs(download_dir: str) -> Mapping[str, object]:
+    """Monta uma única vez as preferências do Firefox para o diretório informado.
 
-    @abstractmethod
-    def get_prefs(self) -> Dict[str, object]:
-        """Retorna as preferência de downloads.
+    :param str download_dir: Diretório de downloads.
+    :return Mapping[str, object]: Preferências imutáveis do Firefox.
+    """
+    prefs = {
+        **_FIREFOX_PREFS,
+        "browser.download.dir": download_dir,
+    }
+    return MappingProxyType(prefs)
 
-        :return Dict[str, object]: Dicionário com as preferências de downloads.
-        """
-        pass
 
-    @abstractmethod
-    def get_options(self) -> object:
-        """Retorna as opções do navegador.
+@functools.lru_cache(maxsize=4)
+def _build_edge_prefs(download_dir: str) -> Mapping[str, object]:
+    """Monta uma única vez as preferências do Edge para o diretório informado.
+
+    :param str download_dir: Diretório de downloads.
+    :return Mapping[str, object]: Preferências imutáveis do Edge.
+    """
+    prefs = {
+        **_EDGE_PREFS,
+        "download.default_directory": download_dir,
+        "savefile.default_directory": download_dir,
+    }
+    return MappingProxyType(prefs)
+
+
+def _build_chrome_options(download_dir: str | None = None, headless: bool = _HEADLESS) -> ChromeOptions:
+    """Monta as opções do Chrome.
+
+    :param str | None download_dir: Diretório de downloads (padrão: diretório de trabalho na importação).
+    :param bool headless: Se o navegador deve ser executado sem interface (padrão: variável HEADLESS).
+    :return ChromeOptions: Objeto de opções do Chrome.
+    """
+    options = ChromeOptions()
+    if headless:
+        options.add_argument(argument="--headless")
+    options.add_argument(argument="--start-maximized")
+
+    options.add_experimental_option(name="prefs", value=dict(_build_chrome_prefs(download_dir or _DOWNLOAD_DIR)))
+    return options
+
+
+def _build_firefox_options(download_dir: str | None = None, headless: bool = _HEADLESS) -> FirefoxOptions:
+    """Monta as opções do Firefox.
+
+    :param str | None download_dir: Diretório de downloads (padrão: diretório de trabalho na importação).
+    :param bool headless: Se o navegador deve ser executado sem interface (padrão: variável HEADLESS).
+    :return FirefoxOptions: Objeto de opções do Firefox.
+    """
+    options = FirefoxOptions()
+    if headless:
+        options.add_argument(argument="--headless")
+
+    prefs = _build_firefox_prefs(download_dir or _DOWNLOAD_DIR)
+    if isinstance(getattr(options, "preferences", None), dict):
+        # set_preference apenas grava no dicionário exposto por `preferences`
+        options.preferences.update(prefs)
+    else:
+        for key, value in prefs.items():
+            options.set_preference(name=key, value=value)
+    return options
+
+
+def _build_edge_options(download_dir: str | None = None, headless: bool = _HEADLESS) -> EdgeOptions:
+    """Monta as opções do Edge.
+
+    :param str | None download_dir: Diretório de downloads (padrão: diretório de trabalho na importação).
+    :param bool headless: Se o navegador deve ser executado sem interface (padrão: variável HEADLESS).
+    :return EdgeOptions: Objeto de opções do Edge.
+    """
+    options = EdgeOptions()
+    if headless:
+        options.add_argument(argument="--headless")
+    options.add_argument(argument="--start-maximized")
+
+    options.add_experimental_option(name="prefs", value=dict(_build_edge_prefs(download_dir or _DOWNLOAD_DIR)))
+    return options
 
-        :return object: Objeto de opções do navagador.
-        """
-        pass
+
+_OptionsBuilder = Callable[[str | None, bool], ChromeOptions | FirefoxOptions | EdgeOptions]
+
+
+class WebDriverOptions:
+    """Base das configurações de opções e preferências do navegador."""
+
+    __slots__ = ("diretorio_download",)
+
+    def __init__(self) -> None:
+        """Define o diretório padrão de downloads."""
+        self.diretorio_download = _DOWNLOAD_DIR
 
 
 class ChromeWebDriverOptions(WebDriverOptions):
     """Configuração de opções e preferências do navegador Chrome."""
 
+    __slots__ = ()
+
     def get_prefs(self) -> Dict[str, object]:
         """Retorna as preferências de download para o Chrome.
 
         :return Dict[str, object]: Dicionário com as preferências de downloads do Chrome.
         """
-        settings = {
-            "recentDestinations": [{"id": "Save as PDF", "origin": "local", "account": ""}],
-            "selectedDestinationId": "Save as PDF",
-            "version": 2,
-        }
-
-        prefs = {
-            "printing.print_preview_sticky_settings.appState": json.dumps(obj=settings),
-            "download.default_directory": self.diretorio_download,
-            "savefile.default_directory": self.diretorio_download,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "plugins.always_open_pdf_externally": True,
-            "ignore-certificate-errors": True,
-            "ignore-ssl-errors=yes": True,
-            "allow-running-insecure-content": True,
-            "disable-web-security": True,
-            "profile.accept_untrusted_certs": True,
-            "safebrowsing.enabled": True,
-            "plugins.plugins_disabled": ["Chrome PDF Viewer"],
-            "safebrowsing.disable_download_protection": True,
-            "profile.default_content_settings.popups": 0,
-        }
-        return prefs
+        return dict(_build_chrome_prefs(self.diretorio_download))
 
     def get_options(self) -> ChromeOptions:
         """Retorna as opções do Chrome.
 
         :return ChromeOptions: Objeto de opções do Chrome.
         """
-        options = ChromeOptions()
-        if os.getenv(key="HEADLESS", default="false").lower() == "true":
-            options.add_argument(argument="--headless")
-        options.add_argument(argument="--start-maximized")
-
-        options.add_experimental_option(name="prefs", value=self.get_prefs())
-        return options
+        return _build_chrome_options(self.diretorio_download)
 
 
 class FirefoxWebDriverOptions(WebDriverOptions):
     """Configuração de opções e preferências do navegador Firefox."""
 
+    __slots__ = ()
+
     def get_prefs(self) -> Dict[str, object]:
         """Retorna as preferências de download para o Firefox.
 
         :return Dict[str, object]: Dicionário com as preferências de download do Firefox.
         """
-        prefs = {
-            "browser.download.folderList": 2,  # 2 = Usar diretório customizado
-            "browser.download.dir": self.diretorio_download,
-            "browser.helperApps.neverAsk.saveToDisk": "application/pdf, application/octet-stream",
-            "pdfjs.disabled": True,  # Abre PDF externamente
-        }
-        return prefs
+        return dict(_build_firefox_prefs(self.diretorio_download))
 
     def get_options(self) -> FirefoxOptions:
         """Retorna as opções do Firefox.
 
         :return FirefoxOptions: Objeto de opções do Firefox.
         """
-        options = FirefoxOptions()
-        if os.getenv(key="HEADLESS", default="false").lower() == "true":
-            options.add_argument(argument="--headless")
-
-        for key, value in self.get_prefs().items():
-            options.set_preference(name=key, value=value)
-        return options
+        return _build_firefox_options(self.diretorio_download)
 
 
 class EdgeWebDriverOptions(WebDriverOptions):
     """Configuração de opções e preferências do navegador Edge."""
 
+    __slots__ = ()
+
     def get_prefs(self) -> Dict[str, object]:
         """Retorna as preferências de download para o Edge.
 
         :return Dict[str, object]: Dicionário com as preferências de download do Edge.
         """
-        prefs = {
-            "download.default_directory": self.diretorio_download,
-            "savefile.default_directory": self.diretorio_download,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True,
-            "plugins.always_open_pdf_externally": True,
-            "excludeSwitches.enable-logging": True,
-        }
-        return prefs
+        return dict(_build_edge_prefs(self.diretorio_download))
 
     def get_options(self) -> EdgeOptions:
         """Retorna as opções do Edge.
 
         :return EdgeOptions: Objeto de opções do Edge.
         """
-        options = EdgeOptions()
-        if os.getenv(key="HEADLESS", default="false").lower() == "true":
-            options.add_argument(argument="--headless")
-        options.add_argument(argument="--start-maximized")
+        return _build_edge_options(self.diretorio_download)
 
-        options.add_experimental_option(name="prefs", value=self.get_prefs())
-        return options
+
+class _DriverManager(Protocol):
+    """Interface comum aos gerenciadores de drivers do webdriver_manager usados pela fábrica."""
+
+    @property
+    def driver(self) -> "Driver": ...
+
+    def install(self) -> str: ...
+
+
+# O webdriver_manager só é necessário quando o Selenium Manager não localiza o driver,
+# por isso os gerenciadores são importados apenas no primeiro uso
+def _chrome_driver_manager() -> _DriverManager:
+    """Retorna o gerenciador de drivers do Chrome.
+
+    :return DriverManager: Instância de ChromeDriverManager.
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager()
+
+
+def _firefox_driver_manager() -> _DriverManager:
+    """Retorna o gerenciador de drivers do Firefox.
+
+    :return DriverManager: Instância de GeckoDriverManager.
+    """
+    from webdriver_manager.firefox import GeckoDriverManager
+
+    return GeckoDriverManager()
+
+
+def _edge_driver_manager() -> _DriverManager:
+    """Retorna o gerenciador de drivers do Edge.
+
+    :return DriverManager: Instância de EdgeChromiumDriverManager.
+    """
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+    return EdgeChromiumDriverManager()
+
+
+class _FastStartServiceMixin(Service):
+    """Inicia o driver sem a espera progressiva do Selenium, verificando a porta em intervalos curtos.
+
+    Reimplementa `Service.start` do Selenium 4.33 e depende dos atributos internos `_path` e `_start_process`.
+    """
+
+    _poll_interval = 0.005
+    _start_timeout = 30
+
+    def start(self) -> None:
+        """Inicia o processo do driver e retorna assim que a porta aceitar conexões.
+
+        :raises WebDriverException: Se o processo encerrar ou não aceitar conexões dentro do tempo limite.
+        """
+        if self._path is None:
+            raise WebDriverException("Service path cannot be None.")
+        self._start_process(self._path)
+
+        deadline = time.monotonic() + self._start_timeout
+        while not self.is_connectable():
+            self.assert_process_still_running()
+            if time.monotonic() > deadline:
+                raise WebDriverException(f"Can not connect to the Service {self._path}")
+            time.sleep(self._poll_interval)
+
+
+class _ChromeService(_FastStartServiceMixin, ChromeService):
+    """Serviço do Chrome com inicialização rápida."""
+
+
+class _FirefoxService(_FastStartServiceMixin, FirefoxService):
+    """Serviço do Firefox com inicialização rápida."""
+
+
+class _EdgeService(_FastStartServiceMixin, EdgeService):
+    """Serviço do Edge com inicialização rápida."""
 
 
 class WebDriverFactory:
     """Factory para criar WebDriver de diferentes navegadores."""
 
-    _browsers = {
-        "chrome": (Chrome, ChromeWebDriverOptions, ChromeService, ChromeDriverManager),
-        "firefox": (Firefox, FirefoxWebDriverOptions, FirefoxService, GeckoDriverManager),
-        "edge": (Edge, EdgeWebDriverOptions, EdgeService, EdgeChromiumDriverManager),
+    # Os Services do Selenium (>= 4.17) aguardam o driver com espera progressiva (0.01s a 0.5s);
+    # _FastStartServiceMixin troca essa espera por verificações a cada 5ms
+    _browsers: Dict[str, tuple[type[WebDriver], _OptionsBuilder, type[Service], Callable[[], _DriverManager]]] = {
+        "chrome": (Chrome, _build_chrome_options, _ChromeService, _chrome_driver_manager),
+        "firefox": (Firefox, _build_firefox_options, _FirefoxService, _firefox_driver_manager),
+        "edge": (Edge, _build_edge_options, _EdgeService, _edge_driver_manager),
     }
 
-    def __init__(self) -> None:
-        """Inicializa a fábrica de WebDriver, determinando o navegador a ser utilizado."""
-        self.browser = os.getenv(key="BROWSER", default="chrome").lower()
+    _driver_binaries = {
+        "chrome": "chromedriver",
+        "firefox": "geckodriver",
+        "edge": "msedgedriver",
+    }
+
+    _driver_path_cache: Dict[str, str] = {}
+
+    _browser_path_cache: Dict[str, str] = {}
+
+    # Resolve o driver (cache, PATH e Selenium Manager) em paralelo com a montagem das opções
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="webdriver_factory")
+
+    def __init__(self, browser: str = _BROWSER, headless: bool = _HEADLESS, download_dir: str = _DOWNLOAD_DIR) -> None:
+        """Inicializa a fábrica de WebDriver, determinando o navegador a ser utilizado.
+
+        :param str browser: Navegador a ser utilizado (padrão: variável BROWSER).
+        :param bool headless: Se o navegador deve ser executado sem interface (padrão: variável HEADLESS).
+        :param str download_dir: Diretório de downloads (padrão: diretório de trabalho na importação).
+        """
+        self.browser = browser.lower()
+        self.headless = headless
+        self.download_dir = download_dir
+        self.browser_upper = self.browser.upper()
         if self.browser not in self._browsers:
-            logging.error("Navegador %s não suportado.", self.browser.upper())
-            raise ValueError(f"Navegador '{self.browser.upper()}' não suportado.")
+            logger.error("Navegador %s não suportado.", self.browser_upper)
+            raise ValueError(f"Navegador '{self.browser_upper}' não suportado.")
+        self._options_builder = self._browsers[self.browser][1]
+        self._pool_size = _POOL_SIZE
+        self._pool: queue.LifoQueue[WebDriver] = queue.LifoQueue(maxsize=max(self._pool_size, 1))
+        _factories.add(self)
+
+        # Localiza o driver em segundo plano (incluindo o Selenium Manager) para que esteja pronto em get_driver
+        self._driver_path_future: Future[str | None] | None = self._executor.submit(self._resolve_driver_path)
+
+    def _new_options(self) -> ChromeOptions | FirefoxOptions | EdgeOptions:
+        """Monta um novo objeto de opções do navegador para cada tentativa de criar o WebDriver.
+
+        As preferências já ficam em cache; um objeto novo evita compartilhar estado alterado pelo Selenium
+        (ex.: `binary_location`) e é mais barato que copiar um objeto existente.
+
+        :return ChromeOptions | FirefoxOptions | EdgeOptions: Objeto de opções do navegador.
+        """
+        return self._apply_browser_path(self._options_builder(self.download_dir, self.headless))
+
+    def _apply_browser_path(
+        self, options: ChromeOptions | FirefoxOptions | EdgeOptions
+    ) -> ChromeOptions | FirefoxOptions | EdgeOptions:
+        """Aplica às opções o navegador localizado (ou baixado) pelo Selenium Manager, se estiver em cache.
+
+        :param ChromeOptions | FirefoxOptions | EdgeOptions options: Objeto de opções do navegador.
+        :return ChromeOptions | FirefoxOptions | EdgeOptions: O mesmo objeto de opções.
+        """
+        browser_path = self._browser_path_cache.get(self.browser)
+        if browser_path:
+            options.binary_location = browser_path
+        return options
+
+    def _find_local_driver(self, manager: Callable[[], _DriverManager]) -> str | None:
+        """Procura no cache do webdriver_manager (drivers.json) um driver para a versão instalada do navegador.
+
+        Ao contrário de `install()`, não consulta a versão mais recente do driver na rede.
+
+        :param Callable[[], DriverManager] manager: Função que retorna o gerenciador de drivers.
+        :return str | None: Caminho do driver compatível com o navegador ou None.
+        """
+        from webdriver_manager.core.driver_cache import DriverCacheManager
+
+        driver = manager().driver
+        browser_version = driver.get_browser_version_from_os()
+        if not browser_version:
+            return None
+
+        cache_manager = DriverCacheManager()
+        prefix = f"{cache_manager.get_os_type()}_{driver.get_name()}_"
+        suffix = f"_for_{browser_version}"
+        for key, driver_info in cache_manager.load_metadata_content().items():
+            path = driver_info.get("binary_path")
+            if key.startswith(prefix) and key.endswith(suffix) and path and os.path.isfile(path):
+                return path
+        return None
+
+    def _get_driver_path(self) -> str | None:
+        """Retorna o caminho de um driver já conhecido, sem consultas de rede.
+
+        Usa o cache da classe e, em seguida, o driver presente no PATH. Retorna None para que
+        o Selenium Manager resolva o driver compatível com o navegador.
+
+        :return str | None: Caminho do executável do driver ou None.
+        """
+        path = self._driver_path_cache.get(self.browser)
+        if path is None:
+            path = shutil.which(self._driver_binaries[self.browser])
+            if path is not None:
+                self._driver_path_cache[self.browser] = path
+        return path
+
+    def _resolve_driver_path(self) -> str | None:
+        """Resolve o driver pelo cache, pelo PATH ou pelo Selenium Manager e armazena o resultado no cache.
+
+        Executada em segundo plano a partir de `__init__`.
+
+        :return str | None: Caminho do executável do driver ou None se o Selenium Manager não o localizar.
+        """
+        path = self._get_driver_path()
+        if path is not None:
+            return path
+
+        service = self._browsers[self.browser][2]
+        options = self._new_options()
+        finder = DriverFinder(service(), options)
+        try:
+            path = finder.get_driver_path()
+        except NoSuchDriverException:
+            logger.debug("Selenium Manager não localizou o driver do navegador %s.", self.browser_upper)
+            return None
+        self._driver_path_cache[self.browser] = path
+        browser_path = finder.get_browser_path()
+        if browser_path:
+            self._browser_path_cache[self.browser] = browser_path
+        return path
+
+    def _install_driver(self, manager: Callable[[], _DriverManager]) -> str:
+        """Obtém o driver pelo webdriver_manager e armazena o caminho no cache da classe.
+
+        Reutiliza um driver já baixado para a versão instalada do navegador antes de recorrer ao `install()`.
+
+        :param Callable[[], DriverManager] manager: Função que retorna o gerenciador de drivers.
+        :raises ValueError: Se ocorrer um erro ao obter o driver.
+        :return str: Caminho do executável do driver.
+        """
+        try:
+            path = self._find_local_driver(manager) or manager().install()
+        except Exception as e:
+            logger.error("Erro ao configurar o serviço do navegador %s", self.browser_upper)
+            raise ValueError(f"Erro ao configurar os serviços do navegador {self.browser_upper}.") from e
+        self._driver_path_cache[self.browser] = path
+        return path
+
+    def _start_driver(self, driver_class: type, options: object, service_instance: object) -> WebDriver:
+        """Inicia a instância do WebDriver.
+
+        :param type driver_class: Classe do WebDriver do navegador.
+        :param object options: Objeto de opções do navegador.
+        :param object service_instance: Serviço do navegador.
+        :return WebDriver: Instância do WebDriver.
+        """
+        driver = driver_class(options=options, service=service_instance)
+        logger.info("WebDriver iniciado para o browser %s com sucesso.", self.browser_upper)
+        # Guarda o driver e o navegador efetivamente usados, inclusive os resolvidos pelo Selenium Manager
+        self._driver_path_cache[self.browser] = driver.service.path
+        browser_path = getattr(options, "binary_location", None)
+        if browser_path:
+            self._browser_path_cache[self.browser] = browser_path
+        return driver
+
+    def _forget_driver_path(self) -> None:
+        """Descarta o driver e o navegador em cache, forçando uma nova busca na próxima chamada."""
+        self._driver_path_cache.pop(self.browser, None)
+        self._browser_path_cache.pop(self.browser, None)
+
+    def _session_error(self) -> ValueError:
+        """Descarta o driver em cache e monta o erro de inicialização do WebDriver.
+
+        :return ValueError: Erro a ser lançado pelo chamador.
+        """
+        # O driver em cache pode ser incompatível com o navegador
+        self._forget_driver_path()
+        logger.error("Erro ao iniciar a instância do WebDriver para o navegador %s.", self.browser_upper)
+        return ValueError(
+            f"Erro ao iniciar a instância do WebDriver para o navegador {self.browser_upper}.\n"
+            f"Verifique se o navegador {self.browser_upper} está instalado e se a versão é compatível com o driver.\n"
+        )
 
     def get_driver(self) -> WebDriver:
         """Cria e retorna uma instância do WebDriver configurado para o navegador escolhido.
 
+        O driver é procurado no cache e no PATH; se não for encontrado ou for incompatível com o navegador,
+        o Selenium Manager o resolve e o webdriver_manager é usado apenas como último recurso.
+
         :raises ValueError: Se o navegador configurado não for suportado
         ou ocorrer um erro ao configurar o serviço.
         :return WebDriver: Instância configurada do WebDriver.
 
         Exemplo de Uso:
         ```
-        factory = WebDriverFactory()
+        factory = get_factory()
         with factory.get_driver() as driver:
             driver.get("https://www.google.com.br")
         ```
         """
-        logging.info("Iniciando configurações do WebDriver para o navegador %s.", self.browser.upper())
-        driver_class, webdriver_options, service, manager = self._browsers[self.browser]
+        logger.info("Iniciando configurações do WebDriver para o navegador %s.", self.browser_upper)
+        driver_class, _, service, manager = self._browsers[self.browser]
 
-        # Configura as opções do navegador
-        options = webdriver_options().get_options()
-        logging.info("Opções do navegador %s configuradas com sucesso.", self.browser.upper())
+        # Monta as opções enquanto a busca do driver iniciada em __init__ ainda roda em segundo plano
+        options = self._options_builder(self.download_dir, self.headless)
+        logger.info("Opções do navegador %s configuradas com sucesso.", self.browser_upper)
 
-        # Configura o serviço do navegador
+        # Configura o serviço do navegador (sem caminho, o Selenium Manager localiza o driver)
         try:
-            service_instance = service(executable_path=manager().install())
-            logging.info("Serviços do navegador %s configurados com sucesso.", self.browser.upper())
+            # A primeira chamada usa a busca em segundo plano; as seguintes consultam o cache
+            prefetch, self._driver_path_future = self._driver_path_future, None
+            driver_path = prefetch.result() if prefetch is not None else self._get_driver_path()
+            # A busca pode ter localizado o navegador depois que as opções foram montadas
+            self._apply_browser_path(options)
+            service_instance = service(executable_path=driver_path)
+            logger.info("Serviços do navegador %s configurados com sucesso.", self.browser_upper)
         except Exception as e:
-            logging.error("Erro ao configurar o serviço do navegador %s", self.browser.upper())
-            raise ValueError(f"Erro ao configurar os serviços do navegador {self.browser.upper()}.") from e
+            logger.error("Erro ao configurar o serviço do navegador %s", self.browser_upper)
+            raise ValueError(f"Erro ao configurar os serviços do navegador {self.browser_upper}.") from e
+
+        # Cria a instância do WebDriver; se a busca em segundo plano já consultou o Selenium Manager
+        # sem sucesso, segue direto para o webdriver_manager
+        if driver_path is not None or prefetch is None:
+            try:
+                return self._start_driver(driver_class, options, service_instance)
+            except NoSuchDriverException:
+                pass
+            except (SessionNotCreatedException, WebDriverException) as e:
+                if driver_path is None:
+                    raise self._session_error() from e
+                self._forget_driver_path()
+                logger.warning(
+                    "Driver %s incompatível com o navegador %s. Utilizando o Selenium Manager.",
+                    driver_path,
+                    self.browser_upper,
+                )
+                try:
+                    return self._start_driver(driver_class, self._new_options(), service())
+                except NoSuchDriverException:
+                    pass
+                except (SessionNotCreatedException, WebDriverException) as retry_error:
+                    raise self._session_error() from retry_error
+
+        logger.warning(
+            "Selenium Manager não localizou o driver do navegador %s. Utilizando o webdriver_manager.",
+            self.browser_upper,
+        )
+        service_instance = service(executable_path=self._install_driver(manager))
+        try:
+            return self._start_driver(driver_class, self._new_options(), service_instance)
+        except (SessionNotCreatedException, WebDriverException) as e:
+            raise self._session_error() from e
+
+    def acquire(self) -> WebDriver:
+        """Retorna um WebDriver do pool ou inicia um novo se o pool estiver vazio.
 
-        # Cria a instância do WebDriver
+        WebDrivers ociosos que não respondem mais (navegador fechado, processo do driver encerrado)
+        são descartados.
+
+        :return WebDriver: Instância configurada do WebDriver.
+        """
+        while True:
+            try:
+                driver = self._pool.get_nowait()
+            except queue.Empty:
+                return self.get_driver()
+            try:
+                driver.current_url
+            except (WebDriverException, MaxRetryError):
+                logger.info("WebDriver ocioso do navegador %s não responde e foi descartado.", self.browser_upper)
+                self._quit_driver(driver)
+                continue
+            logger.info("WebDriver do navegador %s reutilizado do pool.", self.browser_upper)
+            return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Limpa cookies e armazenamento do WebDriver e o devolve ao pool.
+
+        O WebDriver é encerrado se o pool estiver desativado (WEBDRIVER_POOL_SIZE=0) ou cheio,
+        ou se o driver não responder.
+
+        :param WebDriver driver: Instância obtida por `acquire`.
+        """
+        if self._pool_size <= 0:
+            self._quit_driver(driver)
+            return
         try:
-            driver = driver_class(options=options, service=service_instance)
-            logging.info("WebDriver iniciado para o browser %s com sucesso.", self.browser.upper())
-        except SessionNotCreatedException as e:
-            logging.error("Erro ao iniciar a instância do WebDriver para o navegador %s.", self.browser.upper())
-            raise ValueError(
-                f"Erro ao iniciar a instância do WebDriver para o navegador {self.browser.upper()}.\n"
-                f"Verifique se o navegador {self.browser.upper()} está instalado e se a versão é compatível com o driver.\n"
-            ) from e
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass  # Páginas sem armazenamento (ex.: about:blank) não permitem a limpeza
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._pool.put_nowait(driver)
+        except Exception:
+            # Pool cheio, ou o driver já foi encerrado (quit() pelo usuário, falha do processo do driver)
+            self._quit_driver(driver)
+
+    def _quit_driver(self, driver: WebDriver) -> None:
+        """Encerra o WebDriver ignorando erros de um processo que já terminou.
+
+        :param WebDriver driver: Instância a ser encerrada.
+        """
+        try:
+            driver.quit()
+        except Exception:
+            logger.debug("WebDriver do navegador %s já estava encerrado.", self.browser_upper)
 
-        return driver
+    @contextmanager
+    def pooled_driver(self) -> Iterator[WebDriver]:
+        """Fornece um WebDriver do pool e o devolve ao final do bloco.
+
+        Exemplo de Uso:
+        ```
+        factory = get_factory()
+        with factory.pooled_driver() as driver:
+            driver.get("https://www.google.com.br")
+        ```
+        """
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close_pool(self) -> None:
+        """Encerra todos os WebDrivers ociosos do pool.
+
+        É chamado automaticamente ao final do processo.
+        """
+        while True:
+            try:
+                driver = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
+
+
+# Fábricas ativas, para encerrar os WebDrivers ociosos dos pools ao final do processo
+_factories: "weakref.WeakSet[WebDriverFactory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Encerra os WebDrivers ociosos de todas as fábricas ativas."""
+    for factory in list(_factories):
+        factory.close_pool()
+
+
+def get_factory(browser: str = _BROWSER, headless: bool = _HEADLESS, cwd: str = _DOWNLOAD_DIR) -> WebDriverFactory:
+    """Retorna a fábrica de WebDriver para a configuração informada, reutilizando instâncias já criadas.
+
+    Os valores padrão são os de BROWSER, HEADLESS e do diretório de trabalho lidos na importação do módulo;
+    para outra configuração, informe os argumentos explicitamente.
+
+    :param str browser: Navegador a ser utilizado (padrão: variável BROWSER).
+    :param bool headless: Se o navegador deve ser executado sem interface (padrão: variável HEADLESS).
+    :param str cwd: Diretório de downloads (padrão: diretório de trabalho na importação).
+    :raises ValueError: Se o navegador informado não for suportado.
+    :return WebDriverFactory: Fábrica de WebDriver configurada.
+
+    Exemplo de Uso:
+    ```
+    with get_factory().get_driver() as driver:
+        driver.get("https://www.google.com.br")
+    ```
+    """
+    return _get_factory(browser.strip().lower(), bool(headless), os.path.abspath(cwd))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_factory(browser: str, headless: bool, cwd: str) -> WebDriverFactory:
+    """Cria a fábrica de WebDriver, memorizada pela configuração já normalizada.
+
+    :param str browser: Navegador em letras minúsculas.
+    :param bool headless: Se o navegador deve ser executado sem interface.
+    :param str cwd: Caminho absoluto do diretório de downloads.
+    :return WebDriverFactory: Fábrica de WebDriver configurada.
+    """
+    return WebDriverFactory(browser=browser, headless=headless, download_dir=cwd)